@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 
-from typing import TypeVar, Dict, List, Optional, Union
+from typing import TypeVar, Any, Dict, List, Optional, Pattern, Callable, TextIO
 import logging
 import argparse
 import sys
@@ -8,14 +8,21 @@ import traceback
 
 import json
 import csv
-import copy
 import re
 import subprocess
-import io
+import os
+import functools
+import itertools
+import operator
 import shutil
 
 from collections import OrderedDict
 
+try:
+    import orjson  # Optional: parses large `kubectl ... --output json` documents several times faster than json
+except ImportError:
+    orjson = None
+
 ################################################################################
 # Constants, global variables, types
 ################################################################################
@@ -25,6 +32,63 @@ JSON = TypeVar('JSON', Dict, List)
 # Constants
 SYM_LINE = '-'
 
+REGEX_SPECIAL_CHARS = frozenset('.^$*+?{}[]\\|()')
+
+# Aliases of field names in filter criteria, see parse_filter_expression()
+FILTER_FIELD_ALIASES = {
+    "kind": "workloadType",
+    "pod": "podName",
+    "type": "type",
+    "container": "name",
+}
+
+# Values of the container 'change' field, see ContainerListItem.is_deleted() and is_new()
+CHANGES_DELETED = frozenset(['Deleted Pod', 'Deleted Container'])
+CHANGES_NEW = frozenset(['New Pod', 'New Container'])
+
+# Container fields compared with the reference, see ContainerListItem.check_if_modified()
+CONTAINER_COMPARED_FIELDS = ('CPURequests', 'CPULimits', 'memoryRequests', 'memoryLimits', 'ephStorageRequests', 'ephStorageLimits', 'PVCList', 'PVCRequests')
+get_container_compared_fields = operator.itemgetter(*CONTAINER_COMPARED_FIELDS)
+get_container_compared_ref_fields = operator.itemgetter(*['ref_' + field for field in CONTAINER_COMPARED_FIELDS])
+
+# Container fields having a reference copy (ref_*), see KubernetesResourceSet.compare_containers()
+CONTAINER_REF_FIELDS = ('CPURequests', 'CPULimits', 'memoryRequests', 'memoryLimits', 'ephStorageRequests', 'ephStorageLimits', 'PVCList', 'PVCQuantity', 'PVCRequests', 'PVCList_not_found')
+
+# Container fields summed up in summary lines, see KubernetesResourceSet.get_resources_total()
+SUMMARY_FIELDS = (
+    'CPURequests', 'CPULimits',
+    'memoryRequests', 'memoryLimits',
+    'ephStorageRequests', 'ephStorageLimits',
+    'PVCList', 'PVCList_not_found',
+
+    'ref_CPURequests', 'ref_CPULimits',
+    'ref_memoryRequests', 'ref_memoryLimits',
+    'ref_ephStorageRequests', 'ref_ephStorageLimits',
+    'ref_PVCList', 'ref_PVCList_not_found'
+)
+
+# Multipliers of memory/storage quantity suffixes, see res_mem_str_to_bytes()
+RES_MEM_SUFFIXES = {
+    'k': 1000,
+    'M': 1000 ** 2,
+    'G': 1000 ** 3,
+    'T': 1000 ** 4,
+    'P': 1000 ** 5,
+    'E': 1000 ** 6,
+
+    'Ki': 1024,  # Kubernetes notation
+    'ki': 1024,  # Kept for compatibility: same notation as in the output
+    'Mi': 1024 ** 2,
+    'Gi': 1024 ** 3,
+    'Ti': 1024 ** 4,
+    'Pi': 1024 ** 5,
+    'Ei': 1024 ** 6
+}
+
+# Suffixes of human-readable memory/storage quantities; index is the power of 1024 or 1000
+RES_MEM_UNITS_1024 = ['', 'ki', 'Mi', 'Gi', 'Ti', 'Pi', 'Ei']
+RES_MEM_UNITS_1000 = ['', 'k', 'M', 'G', 'T', 'P', 'E']
+
 # https://dev.to/ifenna__/adding-colors-to-bash-scripts-48g4
 COLOR_NONE = ''
 COLOR_RESET = '\033[0m'
@@ -317,6 +381,8 @@ dump: Dict = {
     'reference': [],
     'error': None
 }
+res_desc_cache: Dict = {}  # Parsed input files: (path, mtime, size) -> JSON, see read_res_desc_from_file()
+res_desc_cluster_cache: Dict = {}  # Parsed namespace content: namespace -> (List[JSON], dump item), see read_res_desc_from_cluster()
 
 
 ################################################################################
@@ -324,7 +390,10 @@ dump: Dict = {
 ################################################################################
 
 class ContainerListItem:
-    fields: OrderedDict = OrderedDict()  # Preserving elements order is important for exporting CSV
+    # No per-instance __dict__: there may be many thousands of containers. Subclasses must declare __slots__ too.
+    __slots__ = ('fields', 'sym_column_separator')
+
+    fields: OrderedDict  # Preserving elements order is important for exporting CSV
 
     sym_column_separator: str
 
@@ -333,6 +402,9 @@ class ContainerListItem:
     # Static variable
     fields_width: Dict = {}
 
+    # Static variable: cache of line templates; they depend on fields_width, so must be reset when widths change
+    templates: Dict = {}
+
     def __init__(self, values: Optional[Dict] = None):
         self.sym_column_separator = '  '
 
@@ -418,12 +490,20 @@ class ContainerListItem:
         for k in config['fields'].keys():
             ContainerListItem.fields_width[k] = 0
 
+        ContainerListItem.reset_templates()
+
+    @staticmethod
+    def reset_templates():
+        ContainerListItem.templates = {}
+
     def generate_keys(self):
-        self.fields['appKey'] = self.fields['appName']
-        self.fields['podKey'] = self.fields['appKey'] + '/' + str(self.fields['podLocalIndex'])
+        self.fields['appKey'] = self.fields['appName']  # Note: appName is already interned
+
+        # Note: interned, so that all containers of a pod share one string and is_same_pod() compares by identity first
+        self.fields['podKey'] = sys.intern('/'.join((self.fields['appKey'], str(self.fields['podLocalIndex']))))
 
         # Note: 'type' is added to the key for sorting (which uses key), so that init containers would go first
-        self.fields['key'] = self.fields['podKey'] + '/' + self.fields['type'] + '/' + self.fields['name']
+        self.fields['key'] = '/'.join((self.fields['podKey'], self.fields['type'], self.fields['name']))
 
     def has_pod(self) -> bool:
         return self.fields["podName"] != ""
@@ -449,25 +529,36 @@ class ContainerListItem:
             return container is not None and self.fields["appName"] == container.fields["appName"]
 
     def is_deleted(self) -> bool:
-        return self.fields['change'] in ['Deleted Pod', 'Deleted Container']
+        return self.fields['change'] in CHANGES_DELETED
 
     def is_new(self) -> bool:
-        return self.fields['change'] in ['New Pod', 'New Container']
+        return self.fields['change'] in CHANGES_NEW
 
     def check_if_modified(self):
-        for res_field in ['CPURequests', 'CPULimits', 'memoryRequests', 'memoryLimits', 'ephStorageRequests', 'ephStorageLimits', 'PVCList', 'PVCRequests']:
+        # Most containers are unchanged: checking all fields with a single tuple comparison first
+        if get_container_compared_fields(self.fields) == get_container_compared_ref_fields(self.fields):
+            return
+
+        for res_field in CONTAINER_COMPARED_FIELDS:
             if self.fields[res_field] != self.fields['ref_' + res_field]:
                 self.fields['change'] = 'Modified'
                 self.fields['changedFields'].add(res_field)
 
     # raw_units is needed here because this function is used by print_csv
-    def get_formatted_fields(self, raw_units: bool) -> Dict:
-        formatted_fields = copy.deepcopy(self.fields)
+    # fields: names of fields to format, all fields if None
+    def get_formatted_fields(self, raw_units: bool, fields: Optional[List] = None) -> Dict:
+        if fields is None:
+            formatted_fields = self.fields.copy()  # Shallow copy is enough: values are only replaced below, never mutated
+        else:
+            formatted_fields = {k: self.fields[k] for k in fields}
 
         # Make human-readable values
         if not self.is_decoration() and not raw_units:
             # CPU fields
             for field in ["CPURequests", "CPULimits", "ref_CPURequests", "ref_CPULimits"]:
+                if field not in formatted_fields:
+                    continue
+
                 if config['units'] == 'bin':
                     formatted_fields[field] = res_cpu_millicores_to_str(value=formatted_fields[field])
                 elif config['units'] == 'si':
@@ -486,6 +577,9 @@ class ContainerListItem:
                 "ref_ephStorageRequests", "ref_ephStorageLimits",
                 "ref_PVCRequests"
             ]:
+                if field not in formatted_fields:
+                    continue
+
                 if config['units'] == 'bin':
                     formatted_fields[field] = res_mem_bytes_to_str_1024(value=formatted_fields[field])
                 elif config['units'] == 'si':
@@ -535,6 +629,33 @@ class ContainerListItem:
         return dynamic_fields
 
     def fields_to_table(self, columns: List, with_color: bool, highlight_changes: bool, make_bold: bool) -> str:
+        template = self.get_table_template(columns=columns, with_color=with_color, highlight_changes=highlight_changes, make_bold=make_bold)
+
+        # Convert template to string; only fields of the template are needed
+        formatted_fields = self.get_formatted_fields(raw_units=False, fields=columns)
+        r: str = template.format(**formatted_fields)
+
+        return r
+
+    def get_table_template(self, columns: List, with_color: bool, highlight_changes: bool, make_bold: bool) -> str:
+        # Template does not depend on values, only on widths (see reset_templates()) and on the change status
+        change = None
+        changed_fields = None
+        if with_color and highlight_changes:
+            change = self.fields['change']
+            if change == 'Modified':
+                changed_fields = frozenset(self.fields['changedFields'])
+
+        template_key = (self.sym_column_separator, tuple(columns), with_color, highlight_changes, make_bold, change, changed_fields)
+
+        template = ContainerListItem.templates.get(template_key)
+        if template is None:
+            template = self.make_table_template(columns=columns, with_color=with_color, highlight_changes=highlight_changes, make_bold=make_bold)
+            ContainerListItem.templates[template_key] = template
+
+        return template
+
+    def make_table_template(self, columns: List, with_color: bool, highlight_changes: bool, make_bold: bool) -> str:
         global config
 
         # Define colors to use
@@ -580,11 +701,7 @@ class ContainerListItem:
 
             template = template + field_template + separator_template
 
-        # Convert template to string
-        formatted_fields = self.get_formatted_fields(raw_units=False)
-        r: str = template.format(**formatted_fields)
-
-        return r
+        return template
 
     @staticmethod
     def get_fields_to_print(output_format: str, with_diff: bool) -> List:
@@ -620,11 +737,6 @@ class ContainerListItem:
         r.append(row)
         return r
 
-    def print_table(self, with_color: bool, with_diff: bool) -> None:
-        lines = self.make_table_lines(with_color=with_color, with_diff=with_diff)
-        for line in lines:
-            print(line)
-
     def make_tree_lines(self, with_color: bool, with_diff: bool, prev_container) -> List[str]:
         global config
 
@@ -639,14 +751,7 @@ class ContainerListItem:
             tree_branch: str = dynamic_fields['_tree_branch_pod']
 
             # Whole row (pod)
-            row_template = '{:' + config['fields']['_tree_branch']['alignment'] + str(ContainerListItem.fields_width['_tree_branch']) + '}'
-
-            if with_color:
-                pod_color_map = config['colors']['changes_tree_pod_branch']
-                row_template = \
-                    pod_color_map[self.fields['change']] + \
-                    row_template + \
-                    COLOR_RESET
+            row_template = self.get_tree_pod_template(with_color=with_color)
 
             row: str = row_template.format(tree_branch)
 
@@ -663,36 +768,48 @@ class ContainerListItem:
         r.append(row)
         return r
 
-    def print_tree(self, with_color: bool, with_diff: bool, prev_container) -> None:
-        lines = self.make_tree_lines(with_color=with_color, with_diff=with_diff, prev_container=prev_container)
-        for line in lines:
-            print(line)
+    def get_tree_pod_template(self, with_color: bool) -> str:
+        global config
 
-    def make_csv_lines(self) -> List[str]:
-        r = list()
+        # Cached along with table templates (see get_table_template()): depends only on width and change status
+        change = None
+        if with_color:
+            change = self.fields['change']
 
-        output = io.StringIO()
+        template_key = ('_tree_branch_pod', with_color, change)
 
-        csv_writer = csv.writer(output, delimiter=',', quotechar='"', quoting=csv.QUOTE_MINIMAL)
+        template = ContainerListItem.templates.get(template_key)
+        if template is None:
+            template = '{:' + config['fields']['_tree_branch']['alignment'] + str(ContainerListItem.fields_width['_tree_branch']) + '}'
 
-        values = self.get_formatted_fields(raw_units=True)
-        csv_writer.writerow(values.values())
+            if with_color:
+                pod_color_map = config['colors']['changes_tree_pod_branch']
+                template = pod_color_map[change] + template + COLOR_RESET
 
-        r.append(output.getvalue().strip())
-        return r
+            ContainerListItem.templates[template_key] = template
 
-    def print_csv(self) -> None:
-        lines = self.make_csv_lines()
-        for line in lines:
-            print(line)
+        return template
+
+    # Note: type of csv writer objects is not public, so Any is used
+    @staticmethod
+    def make_csv_writer(output: TextIO) -> Any:
+        return csv.writer(output, delimiter=',', quotechar='"', quoting=csv.QUOTE_MINIMAL, lineterminator='\n')
+
+    def get_csv_row(self) -> List:
+        values = self.get_formatted_fields(raw_units=True)
+        return list(values.values())
 
 
 class ContainerListLine(ContainerListItem):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
         self.sym_column_separator = '-' * len(self.sym_column_separator)
 
     def reset(self):
+        super().reset()
+
         for k, v in ContainerListItem.fields_width.items():
             self.fields[k] = SYM_LINE * ContainerListItem.fields_width[k]
 
@@ -727,17 +844,21 @@ class ContainerListLine(ContainerListItem):
         r.append(row)
         return r
 
-    def make_csv_lines(self) -> List[str]:
+    def get_csv_row(self) -> List:
         raise RuntimeError('ContainerListLine is not expected to be exported to CSV')
 
 
 class ContainerListHeader(ContainerListItem):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
     def reset(self):
         global config
 
+        super().reset()
+
         for k in config['fields']:
             self.fields[k] = config['fields'][k]['header']
 
@@ -761,13 +882,13 @@ class ContainerListHeader(ContainerListItem):
         r.append(row)
         return r
 
-    def make_csv_lines(self) -> List[str]:
-        for key in self.fields.keys():
-            self.fields[key] = key
-        return super().make_csv_lines()
+    def get_csv_row(self) -> List:
+        return list(self.fields.keys())
 
 
 class ContainerListSummary(ContainerListItem):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
@@ -786,12 +907,14 @@ class ContainerListSummary(ContainerListItem):
         r.append(row)
         return r
 
-    def make_csv_lines(self):
+    def get_csv_row(self) -> List:
         raise RuntimeError('ContainerListSummary is not expected to be exported to CSV')
 
 
 class PVCListItem:
-    fields: OrderedDict = OrderedDict()  # Preserving elements order is important for exporting CSV
+    __slots__ = ('fields',)  # Same as ContainerListItem
+
+    fields: OrderedDict  # Preserving elements order is important for exporting CSV
 
     def __init__(self):
         self.reset()
@@ -806,7 +929,7 @@ class PVCListItem:
             ('storageClassName', ''),  # str
 
             ('containerList', set()),  # List of strings - keys of containers using this PVC
-            ('containerQuantity', int),  # int, containers using this PVC
+            ('containerQuantity', 0),  # int, containers using this PVC
 
             ('requests', 0),  # int, bytes
 
@@ -836,10 +959,10 @@ class PVCListItem:
 
 
 class KubernetesResourceSet:
-    containers: List[ContainerListItem] = list()
-    pvcs: List[PVCListItem] = list()
+    containers: List[ContainerListItem]
+    pvcs: List[PVCListItem]
 
-    all_resources = None
+    all_resources: Optional['KubernetesResourceSet']
 
     def __init__(self):
         self.reset()
@@ -851,8 +974,8 @@ class KubernetesResourceSet:
 
     def renew_keys(self) -> None:
         # Sort
-        self.containers = sorted(self.containers, key=lambda c: (c.fields['appName'] + '/' + c.fields['podName'] + '/' + c.fields['name']))
-        self.pvcs = sorted(self.pvcs, key=lambda p: p.fields['name'])
+        self.containers.sort(key=lambda c: '/'.join((c.fields['appName'], c.fields['podName'], c.fields['name'])))
+        self.pvcs.sort(key=lambda p: p.fields['name'])
 
         # Regenerate indices and keys: containers
         app_index: int = 0
@@ -861,36 +984,33 @@ class KubernetesResourceSet:
         container_index: int = 0  # Global
         container_local_index: int = 0  # Within pod
 
+        prev_container: Optional[ContainerListItem] = None
         for container in self.containers:
-            # Indices
-            if container_index > 0:
-                if not self.containers[container_index - 1].is_same_app(container, trust_key=False):
-                    app_index = app_index + 1
-            container.fields['appIndex'] = app_index + 1
-
-            if container_index > 0:
-                if not self.containers[container_index - 1].is_same_pod(container, trust_key=False):
-                    pod_index = pod_index + 1
-            container.fields['podIndex'] = pod_index + 1
+            # Indices: each relation to the previous container is checked only once
+            if prev_container is not None:
+                same_app: bool = prev_container.is_same_app(container, trust_key=False)
+                same_pod: bool = prev_container.is_same_pod(container, trust_key=False)
 
-            if container_index > 0:
-                if not self.containers[container_index - 1].is_same_app(container, trust_key=False):
+                if not same_app:
+                    app_index = app_index + 1
                     pod_local_index = 0
-                else:
-                    if not self.containers[container_index - 1].is_same_pod(container, trust_key=False):
-                        pod_local_index = pod_local_index + 1
-            container.fields['podLocalIndex'] = pod_local_index + 1
+                elif not same_pod:
+                    pod_local_index = pod_local_index + 1
 
-            if container_index > 0:
-                if not self.containers[container_index - 1].is_same_pod(container, trust_key=False):
+                if not same_pod:
+                    pod_index = pod_index + 1
                     container_local_index = 0
                 else:
                     container_local_index = container_local_index + 1
-            container.fields['localIndex'] = container_local_index + 1
 
+            container.fields['appIndex'] = app_index + 1
+            container.fields['podIndex'] = pod_index + 1
+            container.fields['podLocalIndex'] = pod_local_index + 1
+            container.fields['localIndex'] = container_local_index + 1
             container.fields['index'] = container_index + 1
 
             container_index = container_index + 1
+            prev_container = container
 
             # Generate keys
             container.generate_keys()
@@ -915,6 +1035,8 @@ class KubernetesResourceSet:
             pvc.fields['containerList'] = set()
             pvc.fields['containerQuantity'] = 0
 
+        pvcs_by_name = self.make_pvc_name_index(allow_deleted=False, allow_new=True)
+
         for container in self.containers:
             if container.is_deleted():
                 continue
@@ -924,7 +1046,7 @@ class KubernetesResourceSet:
             container.fields['PVCList_not_found'] = set()
 
             for pvc_name in container.fields['PVCList']:
-                pvc = self.get_pvc_by_name(name=pvc_name, allow_deleted=False, allow_new=True)
+                pvc = pvcs_by_name.get(pvc_name)
 
                 if pvc is not None:
                     container.fields['PVCQuantity'] = container.fields['PVCQuantity'] + 1
@@ -939,8 +1061,8 @@ class KubernetesResourceSet:
                     container.fields['PVCList_not_found'].add(pvc_name)
 
     def sort(self) -> None:
-        self.containers = sorted(self.containers, key=lambda c: c.fields['key'])
-        self.pvcs = sorted(self.pvcs, key=lambda p: p.fields['key'])
+        self.containers.sort(key=lambda c: c.fields['key'])
+        self.pvcs.sort(key=lambda p: p.fields['key'])
 
     # Note: each field in criteria is a regex
     def filter(self, criteria: ContainerListItem, inverse: bool):
@@ -952,16 +1074,23 @@ class KubernetesResourceSet:
 
         r.pvcs = self.pvcs  # TODO: Think if filter is to be applied here. May be not.
 
+        # Compile regular expressions once instead of once per container
+        matchers: List = list()
+        for field in ["workloadType", "podName", "type", "name"]:
+            if criteria.fields[field] == '':
+                continue
+            matchers.append((field, compile_matcher(criteria.fields[field])))
+
         for container in self.containers:
             matches = True
-            for field in ["workloadType", "podName", "type", "name"]:
-                if criteria.fields[field] == '':
-                    continue
-
-                match_by_field = bool(re.search(criteria.fields[field], container.fields[field]))
+            for field, matcher in matchers:
+                match_by_field = matcher(container.fields[field])
                 if inverse:
                     match_by_field = not match_by_field
-                matches = matches and match_by_field
+
+                if not match_by_field:
+                    matches = False
+                    break
 
             if matches:
                 r.containers.append(container)
@@ -982,32 +1111,34 @@ class KubernetesResourceSet:
             'ref_all_pvcs': 0
         }
 
-        # FILTERED pods quantity, containers quantity, sum of all resources (except PVC)
+        # Summed fields are split by type once, not for every container
+        int_fields: List[str] = list()
+        set_fields: List[str] = list()
+        for field in SUMMARY_FIELDS:
+            if type(r.fields[field]) is int:
+                int_fields.append(field)
+            elif type(r.fields[field]) is set:
+                set_fields.append(field)
+            else:
+                raise RuntimeError("Invalid type of field {} used for summary: {}".format(
+                    field,
+                    type(r.fields[field])
+                ))
+
+        # FILTERED pods quantity, containers quantity, sum of all resources (except PVC) - in a single pass
+        filtered_pods = set()
         for container in self.containers:
-            for field in [
-                'CPURequests', 'CPULimits',
-                'memoryRequests', 'memoryLimits',
-                'ephStorageRequests', 'ephStorageLimits',
-                'PVCList', 'PVCList_not_found',
-
-                'ref_CPURequests', 'ref_CPULimits',
-                'ref_memoryRequests', 'ref_memoryLimits',
-                'ref_ephStorageRequests', 'ref_ephStorageLimits',
-                'ref_PVCList', 'ref_PVCList_not_found'
-            ]:
-                if type(r.fields[field]) is int:
-                    r.fields[field] = r.fields[field] + container.fields[field]
-                elif type(r.fields[field]) is set:
-                    r.fields[field] = r.fields[field].union(container.fields[field])
-                else:
-                    raise RuntimeError("Invalid type of field {} used for summary: {}".format(
-                        field,
-                        type(r.fields[field])
-                    ))
+            # Same conditions as get_pod_quantity() and get_container_quantity() with allow_deleted=False, allow_new=True
+            if not container.is_deleted():
+                stat['filtered_containers'] = stat['filtered_containers'] + 1
+                filtered_pods.add(container.fields['podKey'])
+
+            for field in int_fields:
+                r.fields[field] = r.fields[field] + container.fields[field]
+            for field in set_fields:
+                r.fields[field].update(container.fields[field])  # In place: r owns this set
 
-        # Filtered pods quantity, containers quantity
-        stat['filtered_pods'] = self.get_pod_quantity(allow_deleted=False, allow_new=True)
-        stat['filtered_containers'] = self.get_container_quantity(allow_deleted=False, allow_new=True)
+        stat['filtered_pods'] = len(filtered_pods)
 
         # ALL pods quantity, containers quantity
         all_resources = self.all_resources
@@ -1028,13 +1159,15 @@ class KubernetesResourceSet:
         r.fields['ref_PVCQuantity'] = stat['ref_used_pvcs']
 
         # Sum of all USED PVC storage sizes
+        pvcs_by_name = self.make_pvc_name_index(allow_deleted=False, allow_new=True)
         for pvc_name in r.fields['PVCList']:
-            pvc = self.get_pvc_by_name(pvc_name, allow_deleted=False, allow_new=True)
+            pvc = pvcs_by_name.get(pvc_name)
             if pvc is not None:
                 r.fields['PVCRequests'] = r.fields['PVCRequests'] + pvc.fields['requests']
 
+        ref_pvcs_by_name = self.make_pvc_name_index(allow_deleted=True, allow_new=False)
         for pvc_name in r.fields['ref_PVCList']:
-            pvc = self.get_pvc_by_name(pvc_name, allow_deleted=True, allow_new=False)
+            pvc = ref_pvcs_by_name.get(pvc_name)
             if pvc is not None:
                 r.fields['ref_PVCRequests'] = r.fields['ref_PVCRequests'] + pvc.fields['ref_requests']
 
@@ -1085,17 +1218,21 @@ class KubernetesResourceSet:
         header = ContainerListHeader()
         summary_items = self.make_summary_items(with_diff=True)  # with_diff is not important for width calculation
 
+        fields_width: Dict = ContainerListItem.fields_width  # Updated in place
+
         # Static fields
-        for container in self.containers + [header] + summary_items:  # Taking maximum length of values of all containers plus header
+        for container in itertools.chain(self.containers, [header], summary_items):  # Taking maximum length of values of all containers plus header
             str_fields = container.get_formatted_fields(raw_units=False)
             for k, v in str_fields.items():
-                ContainerListItem.fields_width[k] = max(ContainerListItem.fields_width[k], len(v))
+                if len(v) > fields_width[k]:
+                    fields_width[k] = len(v)
 
         # Dynamic fields: they rely on values and width of static fields
         for container in self.containers:  # Taking maximum length of values of all containers plus header
             str_fields = container.get_dynamic_fields()
             for k, v in str_fields.items():
-                ContainerListItem.fields_width[k] = max(ContainerListItem.fields_width[k], len(v))
+                if len(v) > fields_width[k]:
+                    fields_width[k] = len(v)
 
         for si in summary_items:
             dynamic_fields: Dict = si.get_dynamic_fields()
@@ -1144,6 +1281,9 @@ class KubernetesResourceSet:
             else:
                 raise RuntimeError("Unexpected view mode: {}".format(view_mode))
 
+        # Templates made while calculating widths are outdated
+        ContainerListItem.reset_templates()
+
     def make_summary_items(self, with_diff: bool) -> List[ContainerListItem]:
         summary = list()
 
@@ -1182,138 +1322,130 @@ class KubernetesResourceSet:
             raise RuntimeError("Invalid output format: {}".format(output_format))
 
     def print_table(self, with_color: bool, with_diff: bool, summary: Optional[List] = False):
-        ContainerListHeader().print_table(with_color=with_color, with_diff=with_diff)
-        ContainerListLine().print_table(with_color=with_color, with_diff=with_diff)
+        lines: List[str] = list()
+
+        lines.extend(ContainerListHeader().make_table_lines(with_color=with_color, with_diff=with_diff))
+        lines.extend(ContainerListLine().make_table_lines(with_color=with_color, with_diff=with_diff))
 
         for container in self.containers:
-            container.print_table(with_color=with_color, with_diff=with_diff)
+            lines.extend(container.make_table_lines(with_color=with_color, with_diff=with_diff))
 
-        ContainerListLine().print_table(with_color=with_color, with_diff=with_diff)
+        lines.extend(ContainerListLine().make_table_lines(with_color=with_color, with_diff=with_diff))
 
         for summary_item in summary:
-            summary_item.print_table(with_color=with_color, with_diff=with_diff)
+            lines.extend(summary_item.make_table_lines(with_color=with_color, with_diff=with_diff))
+
+        write_lines(lines)
 
     def print_tree(self, with_color: bool, with_diff: bool, summary: Optional[List] = False):
-        ContainerListHeader().print_tree(with_color=with_color, with_diff=with_diff, prev_container=None)
-        ContainerListLine().print_tree(with_color=with_color, with_diff=with_diff, prev_container=None)
+        lines: List[str] = list()
+
+        lines.extend(ContainerListHeader().make_tree_lines(with_color=with_color, with_diff=with_diff, prev_container=None))
+        lines.extend(ContainerListLine().make_tree_lines(with_color=with_color, with_diff=with_diff, prev_container=None))
 
         prev_container = None
         for container in self.containers:
-            container.print_tree(with_color=with_color, with_diff=with_diff, prev_container=prev_container)
+            lines.extend(container.make_tree_lines(with_color=with_color, with_diff=with_diff, prev_container=prev_container))
             prev_container = container
 
-        ContainerListLine().print_tree(with_color=with_color, with_diff=with_diff, prev_container=None)
+        lines.extend(ContainerListLine().make_tree_lines(with_color=with_color, with_diff=with_diff, prev_container=None))
 
         for summary_item in summary:
-            summary_item.print_tree(with_color=with_color, with_diff=with_diff, prev_container=None)
+            lines.extend(summary_item.make_tree_lines(with_color=with_color, with_diff=with_diff, prev_container=None))
+
+        write_lines(lines)
 
     def print_csv(self):
-        ContainerListHeader().print_csv()
+        # One writer for all rows
+        csv_writer = ContainerListItem.make_csv_writer(sys.stdout)
 
-        for row in self.containers:
-            row.print_csv()
+        csv_writer.writerow(ContainerListHeader().get_csv_row())
+        csv_writer.writerows(row.get_csv_row() for row in self.containers)
 
     def add_pod(self) -> ContainerListItem:
-        i: int = len(self.containers)
-
-        container: ContainerListItem
-
-        self.containers.append(ContainerListItem())
-        container = self.containers[i]
+        container = ContainerListItem()
+        self.containers.append(container)
 
         return container
 
     def add_container(self) -> ContainerListItem:
-        i: int = len(self.containers)
-
-        if i == 0:  # TODO: Add context
+        if len(self.containers) == 0:  # TODO: Add context
             raise RuntimeError("Trying to add container when no any pod is added")
 
-        if not self.containers[i - 1].has_pod():
+        last_container: ContainerListItem = self.containers[-1]
+
+        if not last_container.has_pod():
             raise RuntimeError("Container can be added only to existing pod")
 
         container: ContainerListItem
-        if self.containers[i - 1].has_container():  # Adding a new record
-            self.containers.append(ContainerListItem())
-            container = self.containers[i]
+        if last_container.has_container():  # Adding a new record
+            container = ContainerListItem()
+            self.containers.append(container)
 
-            container.fields["appName"] = self.containers[i - 1].fields["appName"]
-            container.fields["workloadType"] = self.containers[i - 1].fields["workloadType"]
-            container.fields["podName"] = self.containers[i - 1].fields["podName"]
+            container.fields["appName"] = last_container.fields["appName"]
+            container.fields["workloadType"] = last_container.fields["workloadType"]
+            container.fields["podName"] = last_container.fields["podName"]
         else:  # There is a pod with no container
-            container = self.containers[-1]
+            container = last_container
 
         return container
 
     def add_pvc(self) -> PVCListItem:
-        i: int = len(self.pvcs)
-
-        pvc: PVCListItem
-
-        self.pvcs.append(PVCListItem())
-        pvc = self.pvcs[i]
+        pvc = PVCListItem()
+        self.pvcs.append(pvc)
 
         return pvc
 
-    def parse_container_resources(self, container_desc: JSON, container_type: str, pod_volumes: JSON):
+    def parse_container_resources(self, container_desc: JSON, container_type: str, pod_volumes: Dict[str, JSON]):
         container: ContainerListItem
         container = self.add_container()
 
-        container.fields["name"] = container_desc["name"]
+        # Note: container names repeat across replicas of the same app, so they are interned like appName
+        container.fields["name"] = sys.intern(container_desc["name"])
         container.fields["type"] = container_type
 
-        try:
-            container.fields["CPURequests"] = res_cpu_str_to_millicores(container_desc["resources"]["requests"]["cpu"])
-        except KeyError:
-            pass
-
-        try:
-            container.fields["CPULimits"] = res_cpu_str_to_millicores(container_desc["resources"]["limits"]["cpu"])
-        except KeyError:
-            pass
-
-        try:
-            container.fields["memoryRequests"] = res_mem_str_to_bytes(container_desc["resources"]["requests"]["memory"])
-        except KeyError:
-            pass
+        # Note: requests and limits are often missing, .get() is used instead of catching KeyError
+        resources: JSON = container_desc.get("resources", {})
+        requests: JSON = resources.get("requests", {})
+        limits: JSON = resources.get("limits", {})
 
-        try:
-            container.fields["memoryLimits"] = res_mem_str_to_bytes(container_desc["resources"]["limits"]["memory"])
-        except KeyError:
-            pass
+        if "cpu" in requests:
+            container.fields["CPURequests"] = res_cpu_str_to_millicores(requests["cpu"])
+        if "cpu" in limits:
+            container.fields["CPULimits"] = res_cpu_str_to_millicores(limits["cpu"])
 
-        try:
-            container.fields["ephStorageRequests"] = res_mem_str_to_bytes(container_desc["resources"]["requests"]["ephemeral-storage"])
-        except KeyError:
-            pass
+        if "memory" in requests:
+            container.fields["memoryRequests"] = res_mem_str_to_bytes(requests["memory"])
+        if "memory" in limits:
+            container.fields["memoryLimits"] = res_mem_str_to_bytes(limits["memory"])
 
-        try:
-            container.fields["ephStorageLimits"] = res_mem_str_to_bytes(container_desc["resources"]["limits"]["ephemeral-storage"])
-        except KeyError:
-            pass
+        if "ephemeral-storage" in requests:
+            container.fields["ephStorageRequests"] = res_mem_str_to_bytes(requests["ephemeral-storage"])
+        if "ephemeral-storage" in limits:
+            container.fields["ephStorageLimits"] = res_mem_str_to_bytes(limits["ephemeral-storage"])
 
         if 'volumeMounts' in container_desc:
             for mount in container_desc["volumeMounts"]:
-                volume_type = None
-                for volume in pod_volumes:
-                    if volume['name'] == mount['name']:
-                        # Usually volume contains two fields: "name" and something identifying type of the volume
-                        volume_fields_except_name = set(volume.keys()) - {'name'}
+                volume = pod_volumes.get(mount['name'])
 
-                        if len(volume_fields_except_name) != 1:
-                            raise RuntimeError("Expecting 2 fields for volume {}, but there are: {}".format(volume['name'], volume.keys()))
+                if volume is None:
+                    raise RuntimeError("Volume mount '{}' not found in pod_descpod volumes".format(mount['name']))
 
-                        volume_type = volume_fields_except_name.pop()
+                # Usually volume contains two fields: "name" and something identifying type of the volume
+                volume_fields_except_name = set(volume.keys()) - {'name'}
 
-                        if volume_type == 'persistentVolumeClaim':
-                            container.fields['PVCList'].add(volume['persistentVolumeClaim']['claimName'])
+                if len(volume_fields_except_name) != 1:
+                    raise RuntimeError("Expecting 2 fields for volume {}, but there are: {}".format(volume['name'], volume.keys()))
 
-                if volume_type is None:
-                    raise RuntimeError("Volume mount '{}' not found in pod_descpod volumes".format(mount['name']))
+                volume_type = volume_fields_except_name.pop()
+
+                if volume_type == 'persistentVolumeClaim':
+                    container.fields['PVCList'].add(sys.intern(volume['persistentVolumeClaim']['claimName']))
 
     def read_res_desc_from_cluster(self, namespace: str, role: str) -> List[JSON]:
         global config
         global dump
+        global res_desc_cluster_cache
 
         r = list()
 
@@ -1327,35 +1459,58 @@ class KubernetesResourceSet:
         )
         dump_item = dump[role][-1]
 
-        for cmd_template in config['cluster_cmd']:
-            cmd = list()
-            for argv in cmd_template:
-                cmd.append(argv.format(namespace))
+        # Same namespace may be given several times (e.g. as input and as reference): query it only once
+        if namespace in res_desc_cluster_cache:
+            r, cached_dump_item = res_desc_cluster_cache[namespace]
+            dump_item.update(cached_dump_item)
+            return r
 
-            dump_item['command'] = ' '.join(cmd)  # Used for exceptions / error messages
+        # All commands are started at once: they wait for the cluster API most of the time, so waiting is overlapped
+        processes: List = list()
+        try:
+            for cmd_template in config['cluster_cmd']:
+                cmd = list()
+                for argv in cmd_template:
+                    cmd.append(argv.format(namespace))
 
-            result: subprocess.CompletedProcess = subprocess.run(cmd, shell=False, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+                dump_item['command'] = ' '.join(cmd)  # Used for exceptions / error messages, also if command cannot be started
 
-            dump_item['return_code'] = result.returncode
+                processes.append((cmd, subprocess.Popen(cmd, shell=False, stdout=subprocess.PIPE, stderr=subprocess.PIPE)))
 
-            if result.returncode != 0:
-                raise RuntimeError(
-                    "Cannot get namespace content, return code is {}. Command: `{}`. Error: {}".format(result.returncode, dump_item['command'], result.stderr.decode('utf-8')))
+            for cmd, process in processes:
+                dump_item['command'] = ' '.join(cmd)  # Used for exceptions / error messages
 
-            content = result.stdout.decode('utf-8')
+                stdout, stderr = process.communicate()
 
-            dump_item['content'] = content  # Needed to store text representation of the content for case when JSON parsing fails
-            dump_item['stderr'] = result.stderr.decode('utf-8')
+                dump_item['return_code'] = process.returncode
+
+                if process.returncode != 0:
+                    raise RuntimeError(
+                        "Cannot get namespace content, return code is {}. Command: `{}`. Error: {}".format(process.returncode, dump_item['command'], stderr.decode('utf-8')))
+
+                content = stdout.decode('utf-8')
 
-            res_desc = json.loads(content)
-            dump_item['content'] = res_desc  # JSON format
+                dump_item['content'] = content  # Needed to store text representation of the content for case when JSON parsing fails
+                dump_item['stderr'] = stderr.decode('utf-8')
 
-            r.append(res_desc)
+                res_desc = json_loads(content)
+                dump_item['content'] = res_desc  # JSON format
+
+                r.append(res_desc)
+        finally:
+            # On failure, commands which are not finished yet are stopped; communicate() reaps them and closes their pipes
+            for cmd, process in processes:
+                if process.returncode is None:
+                    process.kill()
+                    process.communicate()
+
+        res_desc_cluster_cache[namespace] = (r, dict(dump_item))
 
         return r
 
     def read_res_desc_from_file(self, filename: str, role: str) -> List[JSON]:
         global dump
+        global res_desc_cache
 
         r = list()
 
@@ -1367,12 +1522,21 @@ class KubernetesResourceSet:
         )
         dump_item = dump[role][-1]
 
-        with open(filename) as file:
-            content = file.read()
+        # Same file may be given several times (e.g. as input and as reference): parse it only once
+        file_stat = os.stat(filename)
+        cache_key = (os.path.realpath(filename), file_stat.st_mtime_ns, file_stat.st_size)
+
+        if cache_key in res_desc_cache:
+            res_desc = res_desc_cache[cache_key]
+        else:
+            with open(filename) as file:
+                content = file.read()
+
+            dump_item['content'] = content  # Needed to store text representation of the content for case when JSON parsing fails
 
-        dump_item['content'] = content  # Needed to store text representation of the content for case when JSON parsing fails
+            res_desc = json_loads(content)
+            res_desc_cache[cache_key] = res_desc
 
-        res_desc = json.loads(content)
         dump_item['content'] = res_desc
 
         r.append(res_desc)
@@ -1426,39 +1590,40 @@ class KubernetesResourceSet:
         # Pod-specific logic
         container: ContainerListItem = self.add_pod()  # Note: this will fill index
 
-        container.fields["podName"] = pod_desc["metadata"]["name"]
+        pod_metadata: JSON = pod_desc["metadata"]
+        pod_spec: JSON = pod_desc["spec"]
+
+        container.fields["podName"] = pod_metadata["name"]
 
         context = {**context, 'podName': container.fields["podName"]}
 
-        if len(pod_desc["metadata"]["ownerReferences"]) != 1:
+        owner_references: JSON = pod_metadata["ownerReferences"]
+        if len(owner_references) != 1:
             raise RuntimeError("Pod has {} owner references; exactly one is expected. Context: {}".format(
-                len(pod_desc["metadata"]["ownerReferences"]),
+                len(owner_references),
                 context
             ))
 
-        container.fields["workloadType"] = pod_desc["metadata"]["ownerReferences"][0]["kind"]
+        # Note: values repeating across pods are interned, so all containers share one string object
+        container.fields["workloadType"] = sys.intern(owner_references[0]["kind"])
 
-        container.fields["appName"] = pod_desc["metadata"]["ownerReferences"][0]["name"]
+        app_name: str = owner_references[0]["name"]
         if container.fields["workloadType"] == 'ReplicaSet':
-            container.fields["appName"] = container.fields["appName"][:container.fields["appName"].rfind('-')]  # Delete all symbols after last '-'
+            app_name = app_name[:app_name.rfind('-')]  # Delete all symbols after last '-'
+        container.fields["appName"] = sys.intern(app_name)
 
         # Storage-specific logic (a part of)
-        # Note: pod_volumes will be used later when parsing containers
-        try:
-            pod_volumes = pod_desc['spec']['volumes']
-        except KeyError:
-            pod_volumes = []
+        # Note: pod_volumes will be used later when parsing containers; indexed by name, as volume mounts refer to volumes by name
+        pod_volumes: Dict[str, JSON] = {volume['name']: volume for volume in pod_spec.get('volumes', [])}
 
         # Container-specific logic
         container_desc: JSON
 
-        if "initContainers" in pod_desc["spec"]:
-            for container_desc in pod_desc["spec"]["initContainers"]:
-                self.parse_container_resources(container_desc=container_desc, container_type="init", pod_volumes=pod_volumes)
+        for container_desc in pod_spec.get("initContainers", []):
+            self.parse_container_resources(container_desc=container_desc, container_type="init", pod_volumes=pod_volumes)
 
-        if "containers" in pod_desc["spec"]:
-            for container_desc in pod_desc["spec"]["containers"]:
-                self.parse_container_resources(container_desc=container_desc, container_type="reg", pod_volumes=pod_volumes)
+        for container_desc in pod_spec.get("containers", []):
+            self.parse_container_resources(container_desc=container_desc, container_type="reg", pod_volumes=pod_volumes)
 
     def load_pvc(self, pvc_desc: JSON, context: Dict) -> None:
         logger.debug("Parsing PVC {}".format(context))
@@ -1468,34 +1633,36 @@ class KubernetesResourceSet:
         pvc.fields['name'] = pvc_desc['metadata']['name']
 
         pvc.fields['uid'] = pvc_desc['metadata']['uid']
-        pvc.fields['storageClassName'] = pvc_desc['spec']['storageClassName']
+        pvc.fields['storageClassName'] = sys.intern(pvc_desc['spec']['storageClassName'])
         pvc.fields['requests'] = res_mem_str_to_bytes(pvc_desc['spec']['resources']['requests']['storage'])
 
-    # Get FIRST container by key
-    def get_container_by_key(self, key: str) -> Union[ContainerListItem, None]:
+    # Index for lookups by key: key -> FIRST container with this key
+    def make_container_index(self) -> Dict[str, ContainerListItem]:
+        r: Dict[str, ContainerListItem] = dict()
         for container in self.containers:
-            if container.fields['key'] == key:
-                return container
+            r.setdefault(container.fields['key'], container)
 
-        return None
+        return r
 
-    def get_pvc_by_key(self, key: str) -> Union[PVCListItem, None]:
+    # Index for lookups by key: key -> FIRST PVC with this key
+    def make_pvc_index(self) -> Dict[str, PVCListItem]:
+        r: Dict[str, PVCListItem] = dict()
         for pvc in self.pvcs:
-            if pvc.fields['key'] == key:
-                return pvc
+            r.setdefault(pvc.fields['key'], pvc)
 
-        return None
+        return r
 
-    def get_pvc_by_name(self, name: str, allow_deleted: bool, allow_new: bool) -> Union[PVCListItem, None]:
+    # Index for lookups by name: name -> FIRST PVC with this name, skipping deleted / new PVCs unless allowed
+    def make_pvc_name_index(self, allow_deleted: bool, allow_new: bool) -> Dict[str, PVCListItem]:
+        r: Dict[str, PVCListItem] = dict()
         for pvc in self.pvcs:
-            if pvc.fields['name'] == name:
-                if pvc.is_deleted() and not allow_deleted:
-                    continue
-                if pvc.is_new() and not allow_new:
-                    continue
-                return pvc
+            if pvc.is_deleted() and not allow_deleted:
+                continue
+            if pvc.is_new() and not allow_new:
+                continue
+            r.setdefault(pvc.fields['name'], pvc)
 
-        return None
+        return r
 
     def get_container_quantity(self, allow_deleted: bool, allow_new: bool) -> int:
         r = 0
@@ -1539,9 +1706,13 @@ class KubernetesResourceSet:
         self.sort()
 
     def compare_pvcs(self, ref_res):
+        # Indices by key: same as in compare_containers()
+        pvcs_by_key = self.make_pvc_index()
+        ref_pvcs_by_key = ref_res.make_pvc_index()
+
         # Added and modified
         for pvc in self.pvcs:
-            ref_pvc = ref_res.get_pvc_by_key(pvc.fields['key'])
+            ref_pvc = ref_pvcs_by_key.get(pvc.fields['key'])
 
             if ref_pvc is None:
                 pvc.fields['change'] = 'New'
@@ -1553,10 +1724,11 @@ class KubernetesResourceSet:
 
         # Deleted
         for ref_pvc in ref_res.pvcs:
-            pvc = self.get_pvc_by_key(ref_pvc.fields['key'])
+            pvc = pvcs_by_key.get(ref_pvc.fields['key'])
 
             if pvc is None:
                 self.pvcs.append(ref_pvc)
+                pvcs_by_key[ref_pvc.fields['key']] = ref_pvc  # Keeping index in sync
 
                 deleted_pvc = self.pvcs[-1]
 
@@ -1570,44 +1742,41 @@ class KubernetesResourceSet:
                 deleted_pvc.fields["requests"] = 0
 
     def compare_containers(self, ref_res):
+        # Indices by key: linear search for every container would make comparison quadratic
+        containers_by_key = self.make_container_index()
+        ref_containers_by_key = ref_res.make_container_index()
+
         # Added and modified
         for container in self.containers:
-            ref_container = ref_res.get_container_by_key(container.fields['key'])
+            ref_container = ref_containers_by_key.get(container.fields['key'])
 
             if ref_container is None:
                 container.fields['change'] = 'New Container'
                 container.fields['changedFields'] = set()
             else:
-                for res_field in ['CPURequests', 'CPULimits', 'memoryRequests', 'memoryLimits', 'ephStorageRequests', 'ephStorageLimits', 'PVCList', 'PVCQuantity', 'PVCRequests', 'PVCList_not_found']:
+                for res_field in CONTAINER_REF_FIELDS:
                     container.fields['ref_' + res_field] = ref_container.fields[res_field]
                 container.check_if_modified()
 
         # Deleted
         for ref_container in ref_res.containers:
-            container = self.get_container_by_key(ref_container.fields['key'])
+            container = containers_by_key.get(ref_container.fields['key'])
 
             if container is None:
                 self.containers.append(ref_container)
+                containers_by_key[ref_container.fields['key']] = ref_container  # Keeping index in sync
 
                 deleted_container = self.containers[-1]
 
-                deleted_container.fields['change'] = 'Deleted Container'
-                deleted_container.fields['changedFields'] = set()
-                deleted_container.fields['podIndex'] = 0
-
-                for res_field in ['CPURequests', 'CPULimits', 'memoryRequests', 'memoryLimits', 'ephStorageRequests', 'ephStorageLimits', 'PVCList', 'PVCQuantity', 'PVCRequests', 'PVCList_not_found']:
-                    deleted_container.fields['ref_' + res_field] = deleted_container.fields[res_field]
-                    if type(deleted_container.fields[res_field]) is int:
-                        deleted_container.fields[res_field] = 0
-                    elif type(deleted_container.fields[res_field]) is str:
-                        deleted_container.fields[res_field] = ''
-                    elif type(deleted_container.fields[res_field]) is set:
-                        deleted_container.fields[res_field] = set()
-                    else:
-                        raise RuntimeError("Invalid type of reference field {}: {}".format(
-                            res_field,
-                            type(deleted_container.fields[res_field])
-                        ))
+                fields = deleted_container.fields
+
+                fields['change'] = 'Deleted Container'
+                fields['changedFields'] = set()
+                fields['podIndex'] = 0
+
+                # Current values become reference ones; current ones are reset to empty values of the same type: 0, '' or set()
+                fields.update({'ref_' + res_field: fields[res_field] for res_field in CONTAINER_REF_FIELDS})
+                fields.update({res_field: type(fields[res_field])() for res_field in CONTAINER_REF_FIELDS})
 
         # Containers -> Pods
         pods_change = dict()
@@ -1648,6 +1817,52 @@ def setup_logging():
     logger.addHandler(syslog)
 
 
+def json_loads(content: str) -> JSON:
+    if orjson is not None:
+        return orjson.loads(content)
+
+    return json.loads(content)
+
+
+# Writing all lines at once is much faster than print() per line
+def write_lines(lines: List[str]) -> None:
+    if len(lines) == 0:
+        return
+
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+
+# Same filters (e.g. from config['summary']) are parsed and applied several times per run
+@functools.lru_cache(maxsize=256)
+def compile_regex(pattern: str) -> Pattern:
+    return re.compile(pattern)
+
+
+# Returns function checking if a value matches the pattern (same as bool(re.search(pattern, value)))
+# Trivial patterns, e.g. plain substrings, are matched without regular expressions
+@functools.lru_cache(maxsize=256)
+def compile_matcher(pattern: str) -> Callable[[str], bool]:
+    if pattern in ['', '.*']:
+        return lambda value: True
+
+    if REGEX_SPECIAL_CHARS.isdisjoint(pattern):
+        return lambda value: pattern in value
+
+    if pattern[:1] == '^' and REGEX_SPECIAL_CHARS.isdisjoint(pattern[1:]):
+        prefix = pattern[1:]
+        return lambda value: value.startswith(prefix)
+
+    # '^((?!abc).)*$' means "not containing abc" (used by default summary and suggested in help)
+    # Note: unlike the regex, this matches multi-line values, but names cannot contain line breaks
+    if len(pattern) > 10 and pattern[:5] == '^((?!' and pattern[-5:] == ').)*$':
+        substring = pattern[5:-5]
+        if REGEX_SPECIAL_CHARS.isdisjoint(substring):
+            return lambda value: substring not in value
+
+    regex = compile_regex(pattern)
+    return lambda value: regex.search(value) is not None
+
+
 def parse_filter_expression(criteria: str) -> ContainerListItem:
     r = ContainerListItem()
 
@@ -1664,14 +1879,7 @@ def parse_filter_expression(criteria: str) -> ContainerListItem:
             parts[0] = parts[0].strip(' ')
 
             # Resolve aliases
-            aliases = {
-                "kind": "workloadType",
-                "pod": "podName",
-                "type": "type",
-                "container": "name",
-            }
-            if parts[0] in aliases.keys():
-                parts[0] = aliases[parts[0]]
+            parts[0] = FILTER_FIELD_ALIASES.get(parts[0], parts[0])
 
             # Validate both parts
             if parts[0] not in r.fields:
@@ -1679,7 +1887,7 @@ def parse_filter_expression(criteria: str) -> ContainerListItem:
                     "Invalid filtering criterion field: '{}'. All criteria: '{}'".format(parts[0], criteria))
 
             try:
-                re.compile(parts[1])
+                compile_regex(parts[1])  # Compiled pattern is cached for filter()
             except re.error as e:
                 raise RuntimeError(
                     "Invalid regular expression for field '{}'. All criterion: '{}'. Error: {}".format(parts[0], criteria, e))
@@ -1690,11 +1898,13 @@ def parse_filter_expression(criteria: str) -> ContainerListItem:
     return r
 
 
+# Conversions below are memoized: they are pure functions and the same values repeat across many containers
+@functools.lru_cache(maxsize=4096)
 def res_cpu_str_to_millicores(value: str) -> int:
     r: int
 
     # https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/#resource-units-in-kubernetes
-    if value[-1:] == "m":
+    if value.endswith("m"):
         r = int(value[:-1])
     else:
         r = int(value) * 1000
@@ -1702,46 +1912,27 @@ def res_cpu_str_to_millicores(value: str) -> int:
     return r
 
 
+@functools.lru_cache(maxsize=4096)
 def res_mem_str_to_bytes(value: str) -> int:
     r: int
 
     # https://kubernetes.io/docs/concepts/configuration/manage-resources-containers/#resource-units-in-kubernetes
-    if value[-1:] == "k":
-        r = int(value[:-1]) * 1000
-    elif value[-1:] == "M":
-        r = int(value[:-1]) * 1000 * 1000
-    elif value[-1:] == "G":
-        r = int(value[:-1]) * 1000 * 1000 * 1000
-    elif value[-1:] == "T":
-        r = int(value[:-1]) * 1000 * 1000 * 1000 * 1000
-    elif value[-1:] == "P":
-        r = int(value[:-1]) * 1000 * 1000 * 1000 * 1000 * 1000
-    elif value[-1:] == "E":
-        r = int(value[:-1]) * 1000 * 1000 * 1000 * 1000 * 1000 * 1000
+    if value[-2:] in RES_MEM_SUFFIXES:
+        r = int(value[:-2]) * RES_MEM_SUFFIXES[value[-2:]]
+    elif value[-1:] in RES_MEM_SUFFIXES:
+        r = int(value[:-1]) * RES_MEM_SUFFIXES[value[-1:]]
 
     # Special case
-    elif value[-1:] == "m":
+    elif value.endswith("m"):
         r = int(round(int(value[:-1]) / 1000, 0))
 
-    elif value[-2:] == "ki":
-        r = int(value[:-2]) * 1024
-    elif value[-2:] == "Mi":
-        r = int(value[:-2]) * 1024 * 1024
-    elif value[-2:] == "Gi":
-        r = int(value[:-2]) * 1024 * 1024 * 1024
-    elif value[-2:] == "Ti":
-        r = int(value[:-2]) * 1024 * 1024 * 1024 * 1024
-    elif value[-2:] == "Pi":
-        r = int(value[:-2]) * 1024 * 1024 * 1024 * 1024 * 1024
-    elif value[-2:] == "Ei":
-        r = int(value[:-2]) * 1024 * 1024 * 1024 * 1024 * 1024 * 1024
-
     else:
         r = int(value)
 
     return r
 
 
+@functools.lru_cache(maxsize=4096)
 def res_cpu_millicores_to_str(value: int) -> str:
     r = str(value) + "m"
 
@@ -1754,56 +1945,29 @@ def res_cpu_millicores_to_str(value: int) -> str:
     return r
 
 
+@functools.lru_cache(maxsize=4096)
 def res_mem_bytes_to_str_1024(value: int) -> str:
     r = str(value)
 
-    if value > 1 * 1024 - 1:
-        r = str(round(float(value) / 1024, 1)) + "ki"
-
-    if value > 1 * 1024 * 1024 - 1:
-        r = str(round(float(value) / 1024 / 1024, 1)) + "Mi"
-
-    if value > 1 * 1024 * 1024 * 1024 - 1:
-        r = str(round(float(value) / 1024 / 1024 / 1024, 1)) + "Gi"
-
-    if value > 1 * 1024 * 1024 * 1024 * 1024 - 1:
-        r = str(round(float(value) / 1024 / 1024 / 1024 / 1024, 1)) + "Ti"
-
-    if value > 1 * 1024 * 1024 * 1024 * 1024 * 1024 - 1:
-        r = str(round(float(value) / 1024 / 1024 / 1024 / 1024 / 1024, 1)) + "Pi"
-
-    if value > 1 * 1024 * 1024 * 1024 * 1024 * 1024 * 1024 - 1:
-        r = str(round(float(value) / 1024 / 1024 / 1024 / 1024 / 1024 / 1024, 1)) + "Ei"
-
-    if value == 0:
-        r = '0'
+    if value > 1024 - 1:
+        power = min((value.bit_length() - 1) // 10, len(RES_MEM_UNITS_1024) - 1)  # 1024 ** power <= value
+        r = str(round(float(value) / (1024 ** power), 1)) + RES_MEM_UNITS_1024[power]
 
     return r
 
 
+@functools.lru_cache(maxsize=4096)
 def res_mem_bytes_to_str_1000(value: int) -> str:
     r = str(value)
 
-    if value > 1 * 1000 - 1:
-        r = str(round(float(value) / 1000, 1)) + "k"
-
-    if value > 1 * 1000 * 1000 - 1:
-        r = str(round(float(value) / 1000 / 1000, 1)) + "M"
-
-    if value > 1 * 1000 * 1000 * 1000 - 1:
-        r = str(round(float(value) / 1000 / 1000 / 1000, 1)) + "G"
-
-    if value > 1 * 1000 * 1000 * 1000 * 1000 - 1:
-        r = str(round(float(value) / 1000 / 1000 / 1000 / 1000, 1)) + "T"
-
-    if value > 1 * 1000 * 1000 * 1000 * 1000 * 1000 - 1:
-        r = str(round(float(value) / 1000 / 1000 / 1000 / 1000 / 1000, 1)) + "P"
+    if value > 1000 - 1:
+        power = min((len(r) - 1) // 3, len(RES_MEM_UNITS_1000) - 1)  # 1000 ** power <= value
 
-    if value > 1 * 1000 * 1000 * 1000 * 1000 * 1000 * 1000 - 1:
-        r = str(round(float(value) / 1000 / 1000 / 1000 / 1000 / 1000 / 1000, 1)) + "E"
+        value_float = float(value)
+        for _ in range(power):  # Not dividing by 1000 ** power at once: result of rounding may differ
+            value_float = value_float / 1000
 
-    if value == 0:
-        r = '0'
+        r = str(round(value_float, 1)) + RES_MEM_UNITS_1000[power]
 
     return r
 
@@ -1816,11 +1980,8 @@ def write_dump(filename: str):
         file.write(content)
 
 
-def parse_args():
-    global args
-
-    epilog = \
-        """
+ARGS_EPILOG = \
+    """
         Example:
         
         ./kubestat.py -o table -r ref_pods.json -r rev_pvcs.json pods.json pvcs.json
@@ -1853,9 +2014,13 @@ def parse_args():
         -f abc,kind=R,type=reg
         """
 
+
+def parse_args():
+    global args
+
     parser = argparse.ArgumentParser(
         description='Provides statistics for resources from `kubectl describe pods -o json`',
-        epilog=epilog,
+        epilog=ARGS_EPILOG,
         formatter_class=argparse.RawTextHelpFormatter
     )
 
@@ -1886,8 +2051,6 @@ def parse_args():
         parser.print_help(sys.stderr)
         sys.exit(0)
 
-    parser.parse_args()
-
     args = parser.parse_args()
 
 